@@ -9,18 +9,29 @@ Comprehensive test of all implemented features:
 import subprocess
 import json
 import sys
+import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 def run_bardclean(*args):
-    """Run bardclean with given arguments and return result."""
+    """Run bardclean with given arguments and return result.
+
+    stdout is redirected to an unlinked temporary file instead of a
+    pipe, which skips the communicate() drain loop and its extra
+    user-space copy once JSON reports grow.
+    """
     cmd = ['python3', 'bardclean.py'] + list(args)
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        cwd=Path(__file__).parent
-    )
-    return result
+    with tempfile.TemporaryFile() as stdout_file:
+        completed = subprocess.run(
+            cmd,
+            stdout=stdout_file,
+            stderr=subprocess.PIPE,
+            cwd=Path(__file__).parent
+        )
+        stdout_file.seek(0)
+        stdout = stdout_file.read().decode('utf-8')
+    return SimpleNamespace(returncode=completed.returncode, stdout=stdout,
+                           stderr=completed.stderr.decode('utf-8'))
 
 def test_poetry_blocking():
     """Test that poetry files are blocked by default."""
@@ -139,9 +150,14 @@ def test_json_output():
                 else:
                     print(f"✗ FAIL: Result missing fields: {missing_result}")
 
-                # Display sample
+                # Display sample: serialize only the summary fields and
+                # the first result instead of dumping the whole payload
+                # and slicing the string
+                sample = {field: data[field] for field in required_fields
+                          if field in data and field != 'results'}
+                sample['results'] = [result_obj]
                 print("\nSample JSON structure:")
-                print(json.dumps(data, indent=2)[:500] + "...")
+                print(json.dumps(sample, indent=2))
 
             else:
                 print("✗ FAIL: Results array empty or missing")
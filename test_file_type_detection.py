@@ -12,7 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from bardclean import DialogueProcessor
 
-def test_file(filepath):
+def check_file(filepath):
     """Test file type detection on a single file."""
     print(f"\n{'='*60}")
     print(f"Testing: {Path(filepath).name}")
@@ -68,7 +68,7 @@ def main():
 
     for filepath in test_files:
         if filepath.exists():
-            test_file(filepath)
+            check_file(filepath)
         else:
             print(f"\nSkipping (not found): {filepath}")
 